@@ -87,9 +87,36 @@ dict_keys(['document_stats', 'sentence_stats', 'contextually_new_words'])
 ```
 """
 
-from lint_ii.core.readability_analysis import ReadabilityAnalysis
-from lint_ii.core.sentence_analysis import SentenceAnalysis
-from lint_ii.core.word_features import WordFeatures
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lint_ii.core.readability_analysis import ReadabilityAnalysis
+    from lint_ii.core.sentence_analysis import SentenceAnalysis
+    from lint_ii.core.word_features import WordFeatures
+
+
+__all__ = [
+    'ReadabilityAnalysis',
+    'SentenceAnalysis',
+    'WordFeatures',
+    'LiNT_II_Exception',
+]
+
+# the analysis classes import spaCy, numpy, etc.; load them on first access
+_LAZY_IMPORTS = {
+    'ReadabilityAnalysis': 'lint_ii.core.readability_analysis',
+    'SentenceAnalysis': 'lint_ii.core.sentence_analysis',
+    'WordFeatures': 'lint_ii.core.word_features',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class LiNT_II_Exception(Exception):
@@ -1,4 +1,38 @@
-from functools import cached_property
+from bisect import bisect_right
+
+import numpy as np
+
+from lint_ii.core.utils import cached_property
+
+
+# lower bounds of difficulty levels 2, 3 and 4; each level is a [lower, upper) range
+_LEVEL_CUTS = (34.0, 46.0, 58.0)
+
+# coefficients of the LiNT-II formula; module-level floats are read on the per-sentence hot path
+_C_CONST = -4.20782
+_C_FREQ = 17.283729
+_C_SDL = -1.624415
+_C_CWC = -2.536780
+_C_CONC = 16.001231
+
+
+def _unclamped_lint_score(
+    freq_log: float | np.ndarray,
+    max_sdl: float | np.ndarray,
+    content_words_per_clause: float | np.ndarray,
+    proportion_concrete: float | np.ndarray,
+) -> float | np.ndarray:
+    """
+    The LiNT-II formula before clamping to [0, 100]; works on floats (`LintScorer.score`) as well as on arrays (`LintScorer.score_batch`).
+    """
+    result = (
+        + _C_CONST
+        + _C_FREQ * freq_log
+        + _C_SDL * max_sdl
+        + _C_CWC * content_words_per_clause
+        + _C_CONC * proportion_concrete
+    )
+    return 100.0 - result
 
 
 class LintScorer:
@@ -45,6 +79,12 @@ class LintScorer:
             - Level 2 [34-46): Moderate text, 29% of adults struggle to understand
             - Level 3 [46-58): Difficult text, 53% of adults struggle to understand
             - Level 4 [58-100]: Very difficult text, 78% of adults struggle
+
+    Methods
+    -------
+    score_batch(features: np.ndarray) -> np.ndarray
+        Calculate LiNT-II scores for an (N, 4) array of feature values at once.
+
     Notes
     -----
     The LiNT-II formula computes readability as:
@@ -93,11 +133,11 @@ class LintScorer:
     """
 
     COEFFICIENTS = {
-        'constant': -4.20782,
-        'freq_log': 17.283729,
-        'max_sdl': -1.624415,
-        'content_words_per_clause': -2.536780,
-        'proportion_concrete': 16.001231,
+        'constant': _C_CONST,
+        'freq_log': _C_FREQ,
+        'max_sdl': _C_SDL,
+        'content_words_per_clause': _C_CWC,
+        'proportion_concrete': _C_CONC,
     }
 
     def __init__(
@@ -127,6 +167,33 @@ class LintScorer:
         self.content_words_per_clause = content_words_per_clause
         self.proportion_concrete = proportion_concrete
 
+    @classmethod
+    def score_batch(cls, features: np.ndarray) -> np.ndarray:
+        """
+        Calculate LiNT-II scores for many sets of feature values at once.
+
+        Parameters
+        ----------
+        features : np.ndarray
+            Array of shape (N, 4); the columns are freq_log, max_sdl, content_words_per_clause and proportion_concrete.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (N,) with the LiNT-II scores, clamped to the [0, 100] range.
+            Rows with a missing (NaN) feature value get a NaN score.
+
+        Raises
+        ------
+        ValueError
+            If `features` is not a 2-dimensional array with 4 columns.
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != 4:
+            raise ValueError(f'features must have shape (N, 4), got {features.shape}')
+        score = _unclamped_lint_score(features[:, 0], features[:, 1], features[:, 2], features[:, 3])
+        return np.clip(score, 0.0, 100.0)
+
     @cached_property
     def score(self) -> float | None:
         if self._meets_guard_rail_requirements:
@@ -140,14 +207,13 @@ class LintScorer:
         return None
 
     @property
-    def _meets_guard_rail_requirements(self):
-        features = [
+    def _meets_guard_rail_requirements(self) -> bool:
+        return None not in (
             self.freq_log,
             self.max_sdl,
             self.content_words_per_clause,
             self.proportion_concrete,
-        ]
-        return all(f is not None for f in features)
+        )
 
     def _calculate_lint_score(self) -> float:
         """
@@ -159,15 +225,13 @@ class LintScorer:
             LiNT readability score (0-100). Higher scores indicate more difficult, 
             less readable text. Scores are clamped to the [0, 100] range.
         """
-        result = (
-            + self.COEFFICIENTS['constant']
-            + self.COEFFICIENTS['freq_log'] * self.freq_log # type: ignore
-            + self.COEFFICIENTS['max_sdl'] * self.max_sdl # type: ignore
-            + self.COEFFICIENTS['content_words_per_clause'] * self.content_words_per_clause # type: ignore
-            + self.COEFFICIENTS['proportion_concrete'] * self.proportion_concrete # type: ignore
+        score = _unclamped_lint_score(
+            self.freq_log, # type: ignore
+            self.max_sdl, # type: ignore
+            self.content_words_per_clause, # type: ignore
+            self.proportion_concrete, # type: ignore
         )
-        score = min(100.0, max(0.0, 100 - result))
-        return score
+        return 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
 
     def _get_difficulty_level(self) -> int:
         """
@@ -183,13 +247,4 @@ class LintScorer:
             - Level 3 [46-58): Difficult text, 53% of adults struggle to understand
             - Level 4 [58-100]: Very difficult text, 78% of adults struggle
         """
-        if self.score < 34: # type: ignore
-            level = 1
-        elif self.score < 46: # type: ignore
-            level = 2
-        elif self.score < 58: # type: ignore
-            level = 3
-        else:
-            level = 4
-
-        return level
\ No newline at end of file
+        return bisect_right(_LEVEL_CUTS, self.score) + 1 # type: ignore
@@ -8,7 +8,7 @@ It handles text extraction from Markdown AST nodes, quotemark normalization, and
 Functions
 ---------
 extract_text_from_node(node: dict | str) -> str
-    Recursively extracts all text content from a Markdown AST node and its children.
+    Extracts all text content from a Markdown AST node and its children.
 
 fix_quotemarks(text: str) -> str
     Normalizes various quotemark styles (curly quotes, guillemets, etc.) to 
@@ -23,48 +23,133 @@ Notes
 - Only text from paragraphs, blockquotes, and lists is extracted; other Markdown elements (headers, code blocks, etc.) are ignored.
 - All quotemark variants are converted to ASCII double quotes (").
 - Multiple consecutive whitespace characters are collapsed to a single space.
+- Plain text without Markdown syntax bypasses the Markdown parser (and does not import mistune).
+- `preprocess_text` caches the results for recently used texts.
 """
 
-import mistune
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
 import re
 
+if TYPE_CHECKING:
+    import mistune
+
+
+# characters that start inline markup: escapes, code spans, emphasis, links, html
+_INLINE_SENTINEL = re.compile(r'[\\`*_\[<]')
+
+# a line break at the end of the block text; the default parser drops it
+# together with any whitespace that follows
+_TRAILING_BREAK_RE = re.compile(r' *\n\s*\Z')
+
+
+@cache
+def _get_markdown() -> 'mistune.Markdown':
+    """
+    Create the Markdown parser (AST renderer) on first use; mistune is only imported when a text contains Markdown syntax.
+    """
+    import mistune
+
+    class _PlainTextInlineParser(mistune.InlineParser):
+        """
+        Inline parser that only tokenizes block text containing inline markup.
+
+        Text without any inline markup becomes a single text token; the line breaks
+        that the default parser turns into (text-less) break tokens are left in the
+        text and collapsed by the whitespace cleanup in `preprocess_text`.
+        """
+
+        def __call__(self, s: str, env) -> list[dict]:
+            if _INLINE_SENTINEL.search(s) is None:
+                return [{'type': 'text', 'raw': _TRAILING_BREAK_RE.sub('', s)}]
+            return super().__call__(s, env)
+
+    return mistune.Markdown(inline=_PlainTextInlineParser())
+
+# top-level Markdown nodes whose text is extracted; all other nodes are ignored
+_TEXT_NODE_TYPES = frozenset({'paragraph', 'block_quote', 'list'})
+
+# Markdown syntax that mistune transforms: block markers at the start of a line,
+# indented code, and inline markup. Text without any of these is parsed into
+# plain paragraphs, so extracting it from the AST is a no-op.
+_MD_SENTINEL = re.compile(
+    r"""
+    (?:^|[\r\n])                                  # start of a line
+    (?:
+        [ ]{0,3}\t | [ ]{4}                         # indented code
+      | [ \t]*(?:
+            \#{1,6}(?:[ \t\r\n]|$)                  # heading
+          | >                                      # block quote
+          | [-+*](?:[ \t\r\n]|$)                   # bullet list item
+          | \d{1,9}[.)](?:[ \t\r\n]|$)             # ordered list item
+          | (?:[-*_][ \t]*){3,}(?:[\r\n]|$)         # thematic break
+          | [=-]+[ \t]*(?:[\r\n]|$)                # setext heading underline
+          | ~{3,}                                  # fenced code
+        )
+    )
+    | [`\[<\\*\v]                                   # code, links, html, escapes, emphasis
+    | (?<![^\W_])_ | _(?![^\W_])                    # underscore emphasis (not intraword)
+    | [\r\n][ \t\r\n\f]*[^\S \t\r\n\f]\s*\Z           # line break + only non-ASCII whitespace
+    """,
+    re.VERBOSE,
+)
+
+_QUOTE_TABLE = str.maketrans(dict.fromkeys("«»‘’‛“”„‟‹›", '"'))
+
 
 def extract_text_from_node(node: dict | str) -> str:
-    """Recursively extract all text from a Markdown AST node and its children."""
-    if isinstance(node, dict):
-        if node.get('type') == 'text':
-            return node.get('raw', '')
-        if 'children' in node:
-            return ' '.join(extract_text_from_node(child) for child in node['children'])
-    return ''
+    """Extract all text from a Markdown AST node and its children (depth-first, in document order)."""
+    parts = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if current.get('type') == 'text':
+                parts.append(current.get('raw', ''))
+            elif 'children' in current:
+                stack.extend(reversed(current['children']))
+    return ' '.join(parts)
+
+
+def _collapse_whitespace(text: str) -> str:
+    """
+    Collapse each run of whitespace to a single space (leading and trailing runs included); `str.split` does the scanning in C, which is faster than a regex substitution.
+    """
+    collapsed = ' '.join(text.split())
+    if not collapsed:
+        return ' ' if text else ''
+    if text[0].isspace():
+        collapsed = ' ' + collapsed
+    if text[-1].isspace():
+        collapsed += ' '
+    return collapsed
 
 
 def fix_quotemarks(text) -> str:
     """
     Normalizes various quotemark styles (curly quotes, guillemets, etc.) to straight double quotes.
     """
-    quotemarks = [i for i in "«»‘’‛“”„‟‹›"]
-    for quotemark in quotemarks:
-        text = text.replace(quotemark, '"')
-    return text
+    return text.translate(_QUOTE_TABLE)
 
 
+@lru_cache(maxsize=128)
 def preprocess_text(text: str) -> str:
     """
     Main preprocessing function that extracts text from Markdown, normalizes quotemarks, and removes redundant whitespace.
+    The results for recently used texts are cached.
     """
-    markdown = mistune.create_markdown(renderer='ast')
-    nodes: list[dict] = markdown(text)  # type: ignore
-    paragraphs = []
+    if _MD_SENTINEL.search(text) is None:
+        combined_text = text.strip(' \t\n\r\f')
+    else:
+        nodes: list[dict] = _get_markdown()(text)  # type: ignore
+        paragraphs = []
 
-    for node in nodes:
-        if node['type'] in ['paragraph', 'block_quote', 'list']:
-            paragraph = extract_text_from_node(node)
-            paragraphs.append(paragraph)
+        for node in nodes:
+            if node['type'] in _TEXT_NODE_TYPES:
+                paragraph = extract_text_from_node(node)
+                paragraphs.append(paragraph)
 
-    combined_text = ' '.join(paragraphs)
-    regex = re.compile(r'\s+')
+        combined_text = ' '.join(paragraphs)
 
-    clean_text, _ = regex.subn(' ', combined_text)
-    clean_text_without_quotemarks = fix_quotemarks(clean_text)
-    return clean_text_without_quotemarks
+    clean_text = _collapse_whitespace(fix_quotemarks(combined_text))
+    return clean_text
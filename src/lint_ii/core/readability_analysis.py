@@ -1,14 +1,20 @@
+from heapq import nsmallest
 from operator import itemgetter
-from functools import cached_property
-from typing import Any, TypedDict
-import statistics
+from math import fsum
+from typing import Any, Iterable, Iterator, NamedTuple, TextIO, TypedDict
+import json
+
+import numpy as np
+from spacy.tokens import Doc
 
 from lint_ii.core.preprocessor import preprocess_text
 from lint_ii.core.word_features import WordFeatures
 from lint_ii.core.sentence_analysis import SentenceAnalysis
 from lint_ii.core.lint_scorer import LintScorer
 from lint_ii.core.sentence_analysis import SentenceAnalysis, SentenceAnalysisDict
+from lint_ii.core.utils import cached_property
 
+from lint_ii.linguistic_data.nlp_model import SPACY_BATCH_SIZE, get_nlp_model, parse_texts
 from lint_ii.visualization.html import LintIIVisualizer
 
 
@@ -29,6 +35,14 @@ class ReadabilityAnalysisDict(TypedDict):
     max_lint_score: float | None
 
 
+class _SentenceAggregates(NamedTuple):
+    frequencies: list[float]
+    sdls: list[int]
+    content_words_per_clause: list[float]
+    n_concrete_nouns: int
+    total_nouns: int
+
+
 class ReadabilityAnalysis(LintIIVisualizer):
     """
     Document-level readability analysis for Dutch texts using the LiNT-II formula.
@@ -48,13 +62,13 @@ class ReadabilityAnalysis(LintIIVisualizer):
     sentences : list[SentenceAnalysis]
         The input sentence analyses.
     word_features : list[WordFeatures]
-        Flattened list of all word features across sentences.
+        Flattened list of all word features across sentences. Cached property.
     concrete_nouns : list[WordFeatures]
-        All concrete nouns in the document.
+        All concrete nouns in the document. Cached property.
     abstract_nouns : list[WordFeatures]
-        All abstract nouns in the document.
+        All abstract nouns in the document. Cached property.
     undefined_nouns : list[WordFeatures]
-        All undefined nouns in the document (have both a concrete and an abstract meaning).
+        All undefined nouns in the document (have both a concrete and an abstract meaning). Cached property.
     mean_log_word_frequency : float | None
         Document-level mean log frequency of content words (excluding proper nouns).
         Returns None if there are no frequencies on the sentence-level. Cached property.
@@ -78,15 +92,25 @@ class ReadabilityAnalysis(LintIIVisualizer):
     max_lint_score : float | None
         Highest sentence-level score in the document.
         Returns None if there are no sentence-level scores. Cached property.
+    document_stats : DocumentStatsDict
+        Summary statistics including sentence count, document score and level, min/max scores. Returns a copy of the cached statistics.
     entities_and_situations : list[WordFeatures]
-        Bag of entities and situations for the document.
+        Bag of entities and situations for the document. Cached property.
     contextually_new : list[WordFeatures]
-        Bag of contextually new words in the document.
+        Bag of contextually new words in the document. Cached property.
 
     Methods
     -------
     from_text(text: str) -> ReadabilityAnalysis
         Create analysis from text string. Preprocesses text and applies spaCy NLP pipeline.
+    from_texts(texts: Iterable[str], batch_size: int = SPACY_BATCH_SIZE, n_process: int = 1) -> Iterator[ReadabilityAnalysis]
+        Create analyses from multiple text strings. The texts are processed by spaCy in batches.
+    from_doc(doc: Doc) -> ReadabilityAnalysis
+        Create analysis from a spaCy Doc that was already parsed; skips pre-processing and parsing.
+    from_docs(docs: Iterable[Doc]) -> list[ReadabilityAnalysis]
+        Create analyses from multiple spaCy Docs that were already parsed.
+    preload() -> None
+        Load the spaCy model and the word lists up front (e.g. when a web server starts).
     get_top_n_least_frequent -> list[tuple[WordFeatures, float]]
         Get the top n least frequent words in the document.
     calculate_document_stats() -> DocumentStatsDict
@@ -95,6 +119,10 @@ class ReadabilityAnalysis(LintIIVisualizer):
         Return comprehensive analysis with both document and sentence-level details.
     as_dict() -> ReadabilityAnalysisDict
         Serialize analysis to dictionary format (used in the LiNT-II visualizer).
+    iter_sentence_dicts() -> Iterator[SentenceAnalysisDict]
+        Serialize the sentences one at a time.
+    dump_json(fp: TextIO) -> None
+        Write the `as_dict()` output as JSON to a file, serializing one sentence at a time.
 
     Examples
     --------
@@ -134,17 +162,52 @@ class ReadabilityAnalysis(LintIIVisualizer):
         (a) Load spaCy model
         (b) Pre-process text (clean-up) and create spaCy Doc object
         (c) Apply sentence-level readability analysis on each sentence in the Doc
+        An empty text (after pre-processing) returns an empty analysis without loading the spaCy model.
         """
-        from lint_ii.linguistic_data.nlp_model import NLP_MODEL
         clean_text = preprocess_text(text)
-        doc = NLP_MODEL(clean_text)
+        if not clean_text:
+            return cls([])
+        return cls.from_doc(get_nlp_model()(clean_text))
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: Iterable[str],
+        batch_size: int = SPACY_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator['ReadabilityAnalysis']:
+        """
+        Create analyses from multiple text strings; same steps as `from_text`, but the texts are parsed in batches, which is faster than calling `from_text` per text.
+        See `parse_texts` for `batch_size` and `n_process`.
+        """
+        for doc in parse_texts(map(preprocess_text, texts), batch_size=batch_size, n_process=n_process):
+            yield cls.from_doc(doc)
+
+    @classmethod
+    def from_doc(cls, doc: Doc) -> 'ReadabilityAnalysis':
+        """
+        Create analysis from a spaCy Doc that was already parsed (with `nl_core_news_lg`); pre-processing and parsing are skipped.
+        """
         sentences = [
             SentenceAnalysis(sent)
             for sent in doc.sents
         ]
         return cls(sentences)
 
-    @property
+    @classmethod
+    def from_docs(cls, docs: Iterable[Doc]) -> list['ReadabilityAnalysis']:
+        """Create analyses from multiple spaCy Docs that were already parsed; see `from_doc`."""
+        return [cls.from_doc(doc) for doc in docs]
+
+    @classmethod
+    def preload(cls) -> None:
+        """
+        Load the spaCy model and the word lists up front (e.g. when a web server starts), so that the first analysis does not pay the loading time.
+        """
+        get_nlp_model()
+        import lint_ii.linguistic_data.wordlists  # noqa: F401
+
+    @cached_property
     def word_features(self) -> list[WordFeatures]:
         """Bag of word features for the document."""
         return [
@@ -153,7 +216,7 @@ class ReadabilityAnalysis(LintIIVisualizer):
             for feat in sentence.word_features
         ]
 
-    @property
+    @cached_property
     def concrete_nouns(self) -> list[WordFeatures]:
         """Bag of concrete nouns for the document."""
         return [
@@ -162,7 +225,7 @@ class ReadabilityAnalysis(LintIIVisualizer):
             for noun in sentence.concrete_nouns
         ]
 
-    @property
+    @cached_property
     def abstract_nouns(self) -> list[WordFeatures]:
         """Bag of abstract nouns for the document."""
         return [
@@ -171,7 +234,7 @@ class ReadabilityAnalysis(LintIIVisualizer):
             for noun in sentence.abstract_nouns
         ]
     
-    @property
+    @cached_property
     def undefined_nouns(self) -> list[WordFeatures]:
         """Bag of undefined nouns for the document."""
         return [
@@ -180,20 +243,41 @@ class ReadabilityAnalysis(LintIIVisualizer):
             for noun in sentence.undefined_nouns
         ]
 
+    @cached_property
+    def _sentence_aggregates(self) -> _SentenceAggregates:
+        """
+        Collect the sentence-level values behind the document-level features in a single pass over the sentences.
+        """
+        frequencies = []
+        sdls = []
+        content_words_per_clause = []
+        n_concrete_nouns = 0
+        total_nouns = 0
+        for sent in self.sentences:
+            frequencies.extend(
+                freq
+                for feat in sent.word_features
+                if (freq := feat.word_frequency) is not None
+            )
+            if (sdl := sent.max_sdl) is not None:
+                sdls.append(sdl)
+            if (cwc := sent.content_words_per_clause) is not None:
+                content_words_per_clause.append(cwc)
+            n_concrete = len(sent.concrete_nouns)
+            n_concrete_nouns += n_concrete
+            total_nouns += n_concrete + len(sent.abstract_nouns) + len(sent.undefined_nouns)
+        return _SentenceAggregates(frequencies, sdls, content_words_per_clause, n_concrete_nouns, total_nouns)
+
     @cached_property
     def mean_log_word_frequency(self) -> float | None:
         """
         Mean log word frequency for the document.
         Returns None if there are no frequencies on the sentence-level.
         """
-        frequencies = [
-            freq
-            for feat in self.word_features
-            if (freq := feat.word_frequency) is not None
-        ]
+        frequencies = self._sentence_aggregates.frequencies
         if not frequencies:
             return None
-        return statistics.mean(frequencies)
+        return fsum(frequencies) / len(frequencies)
 
     @cached_property
     def mean_max_sdl(self) -> float | None:
@@ -201,10 +285,12 @@ class ReadabilityAnalysis(LintIIVisualizer):
         Mean value of sentence-level maximum dependency lengths.
         Returns None if there are no SDLs on the sentence-level.
         """
-        sdls = [s.max_sdl for s in self.sentences if s.max_sdl is not None]
+        sdls = self._sentence_aggregates.sdls
         if not sdls:
             return None
-        return statistics.mean(sdls)
+        # the SDLs are ints, so the sum is exact; like `statistics.mean`, a whole mean stays an int
+        total, n = sum(sdls), len(sdls)
+        return total // n if total % n == 0 else total / n
 
     @cached_property
     def mean_content_words_per_clause(self) -> float | None:
@@ -212,14 +298,10 @@ class ReadabilityAnalysis(LintIIVisualizer):
         Mean value of sentence-level content words per clause.
         Returns None if there are no content words / clause on the sentence-level.
         """
-        content_words_per_clause = [
-            s.content_words_per_clause
-            for s in self.sentences
-            if s.content_words_per_clause is not None
-        ]
+        content_words_per_clause = self._sentence_aggregates.content_words_per_clause
         if not content_words_per_clause:
             return None
-        return statistics.mean(content_words_per_clause)
+        return fsum(content_words_per_clause) / len(content_words_per_clause)
 
     @cached_property
     def proportion_of_concrete_nouns(self) -> float | None:
@@ -228,13 +310,10 @@ class ReadabilityAnalysis(LintIIVisualizer):
         Nouns of type `unknown` (not in the list) are excluded from the totals count.
         Returns None if totals are 0, i.e. there are no nouns or only `unknown` nouns in the sentence.
         """
-        n_concrete_nouns = len(self.concrete_nouns)
-        n_abstract_nouns = len(self.abstract_nouns)
-        n_undefined_nouns = len(self.undefined_nouns)
-        total_nouns = n_concrete_nouns + n_abstract_nouns + n_undefined_nouns
-        if total_nouns == 0:
+        aggregates = self._sentence_aggregates
+        if aggregates.total_nouns == 0:
             return None
-        return n_concrete_nouns / total_nouns
+        return aggregates.n_concrete_nouns / aggregates.total_nouns
 
     @cached_property
     def lint(self) -> LintScorer:
@@ -245,13 +324,30 @@ class ReadabilityAnalysis(LintIIVisualizer):
             proportion_concrete = self.proportion_of_concrete_nouns,
         )
 
+    @cached_property
+    def _lint_scores(self) -> np.ndarray:
+        """
+        Sentence-level LiNT scores as an array, calculated for all sentences at once with `LintScorer.score_batch`.
+        Sentences with a missing feature value are left out (guard rail).
+        """
+        features = np.array(
+            [
+                [
+                    sent.mean_log_word_frequency,
+                    sent.max_sdl,
+                    sent.content_words_per_clause,
+                    sent.proportion_of_concrete_nouns,
+                ]
+                for sent in self.sentences
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        scores = LintScorer.score_batch(features)
+        return scores[~np.isnan(features).any(axis=1)]
+
     @cached_property
     def lint_scores_per_sentence(self) -> list[float]:
-        return [
-            sent.lint.score
-            for sent in self.sentences
-            if sent.lint.score is not None
-        ]
+        return self._lint_scores.tolist()
 
     @cached_property
     def min_lint_score(self) -> float | None:
@@ -259,7 +355,9 @@ class ReadabilityAnalysis(LintIIVisualizer):
         Lowest sentence-level score in the document.
         Returns None if there are no sentence-level scores.
         """
-        return min(self.lint_scores_per_sentence, default=None)
+        if self._lint_scores.size == 0:
+            return None
+        return float(self._lint_scores.min())
 
     @cached_property
     def max_lint_score(self) -> float | None:
@@ -267,33 +365,33 @@ class ReadabilityAnalysis(LintIIVisualizer):
         Highest sentence-level score in the document.
         Returns None if there are no sentence-level scores.
         """
-        return max(self.lint_scores_per_sentence, default=None)
+        if self._lint_scores.size == 0:
+            return None
+        return float(self._lint_scores.max())
 
-    @property
+    @cached_property
     def entities_and_situations(self) -> list[WordFeatures]:
         """Bag of entities and situations for the document."""
         return [feat for feat in self.word_features if feat.is_entity_or_situation]
 
-    @property
+    @cached_property
     def contextually_new(self) -> list[WordFeatures]:
         """Bag of contextually new words in the document."""
         return [feat for feat in self.word_features if feat.is_contextually_new]
 
     def get_top_n_least_frequent(self, n: int = 5) -> list[tuple[WordFeatures, float]]:
         """Get the top n least frequent words in the document."""
-        frequencies = {
-            feat:freq
+        frequencies = [
+            (feat, freq)
             for feat in self.word_features
             if (freq := feat.word_frequency) is not None
-        }
+        ]
         if n == -1:
-            return sorted(frequencies.items(), key=itemgetter(1))
-        return sorted(frequencies.items(), key=itemgetter(1))[:n]
+            return sorted(frequencies, key=itemgetter(1))
+        return nsmallest(n, frequencies, key=itemgetter(1))
 
-    def calculate_document_stats(self) -> DocumentStatsDict:
-        """
-        Statistics on a document level (sentence count, document LiNT score, document difficulty level, min LiNT score, max LiNT score).
-        """
+    @cached_property
+    def _document_stats(self) -> DocumentStatsDict:
         return {
             'sentence_count': len(self.sentences),
             'document_lint_score': self.lint.score,
@@ -301,6 +399,18 @@ class ReadabilityAnalysis(LintIIVisualizer):
             'min_lint_score': self.min_lint_score,
             'max_lint_score': self.max_lint_score,
         }
+
+    @property
+    def document_stats(self) -> DocumentStatsDict:
+        """
+        Statistics on a document level (sentence count, document LiNT score, document difficulty level, min LiNT score, max LiNT score).
+        """
+        # shallow copy: changes by the caller must not leak into the cached statistics
+        return self._document_stats.copy()
+
+    def calculate_document_stats(self) -> DocumentStatsDict:
+        """Statistics on a document level; same as `document_stats`."""
+        return self.document_stats
     
     def get_detailed_analysis(self, n: int = 5) -> dict[str, Any]:
         """Get detailed readability analysis per sentence in the document."""
@@ -314,12 +424,39 @@ class ReadabilityAnalysis(LintIIVisualizer):
         }
 
     def as_dict(self) -> ReadabilityAnalysisDict:
-        doc_stats = self.calculate_document_stats()
+        doc_stats = self._document_stats
         return {
-            'sentences': [sent.as_dict() for sent in self.sentences],
+            'sentences': list(self.iter_sentence_dicts()),
             'document_lint_score': doc_stats['document_lint_score'],
             'document_difficulty_level': doc_stats['document_difficulty_level'],
             'sentence_count': doc_stats['sentence_count'],
             'min_lint_score': doc_stats['min_lint_score'],
             'max_lint_score': doc_stats['max_lint_score'],
         }
+
+    def iter_sentence_dicts(self) -> Iterator[SentenceAnalysisDict]:
+        """Serialize the sentences one at a time (the `sentences` part of `as_dict`)."""
+        for sent in self.sentences:
+            yield sent.as_dict()
+
+    def dump_json(self, fp: TextIO) -> None:
+        """
+        Write `as_dict()` as JSON to a text file object (same output as `json.dump(analysis.as_dict(), fp)`).
+        The sentences are serialized one at a time, so the dictionaries of all sentences are never in memory together.
+        """
+        fp.write('{"sentences": [')
+        for i, sent_dict in enumerate(self.iter_sentence_dicts()):
+            if i:
+                fp.write(', ')
+            fp.write(json.dumps(sent_dict))
+        fp.write(']')
+        doc_stats = self._document_stats
+        for key in (
+            'document_lint_score',
+            'document_difficulty_level',
+            'sentence_count',
+            'min_lint_score',
+            'max_lint_score',
+        ):
+            fp.write(f', {json.dumps(key)}: {json.dumps(doc_stats[key])}')
+        fp.write('}')
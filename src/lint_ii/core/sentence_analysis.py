@@ -1,17 +1,23 @@
 from __future__ import annotations
+from collections import defaultdict
+from heapq import nsmallest
+from itertools import accumulate
 from operator import itemgetter
-from functools import cached_property
-from typing import Any, TypedDict, TYPE_CHECKING
-import statistics
+from math import fsum
+from typing import Any, Iterable, Iterator, NamedTuple, TypedDict, TYPE_CHECKING
 
-from spacy.tokens import Doc, Span, Token
+from spacy.tokens import Doc, DocBin, Span, Token
 
 from lint_ii.core.preprocessor import preprocess_text
 from lint_ii.core.lint_scorer import LintScorer
-from lint_ii.core.word_features import WordFeatures, WordFeaturesDict
+from lint_ii.core.word_features import _CONJ, _PUNCT, WordFeatures, WordFeaturesDict
+from lint_ii.core.utils import cached_property
+from lint_ii.linguistic_data import SuperSemTypes
+from lint_ii.linguistic_data.nlp_model import SPACY_BATCH_SIZE, get_nlp_model, parse_text, parse_texts
 if TYPE_CHECKING:
     from lint_ii.core.readability_analysis import ReadabilityAnalysis
 
+
 class SDLInfo(TypedDict):
     token: str
     dep_length: int
@@ -28,6 +34,19 @@ class SentenceAnalysisDict(TypedDict):
     content_words_per_clause: float | None
 
 
+class _SentenceBuckets(NamedTuple):
+    concrete: list[WordFeatures]
+    abstract: list[WordFeatures]
+    undefined: list[WordFeatures]
+    unknown: list[WordFeatures]
+    content_words: list[WordFeatures]
+    finite_verbs: list[WordFeatures]
+    frequencies: list[float]
+    non_punct: list[WordFeatures]
+    dep_lengths: list[int]
+    pronouns: defaultdict[int, list[WordFeatures]]
+
+
 class SentenceAnalysis:
     """
     Sentence-level readability analysis for Dutch texts using the LiNT-II formula.
@@ -47,7 +66,7 @@ class SentenceAnalysis:
     doc : Doc | Span
         The input spaCy sentence object.
     text : str
-        Sentence as string.
+        Sentence as string. Cached property.
     word_features : list[WordFeatures]
         Linguistic features for each token in the sentence. Cached property.
     mean_log_word_frequency : float | None
@@ -95,20 +114,28 @@ class SentenceAnalysis:
     adjectival_modifiers_per_clause : float
         Number of adjectival modifiers per clause. Any conjunctions nested inside the modifier are added to the count. Cached property.
     coordinated_constituents : list[WordFeatures]
-        List of coordinated constituents in the sentence.
+        List of coordinated constituents in the sentence. Cached property.
     coordinated_constituents_per_clause : float
         Number of coordinated constituents per clause. Cached property.
     pronouns : dict[int, list[WordFeatures]]
         Pronouns in the sentence categorized by person (first, second, third).
     humans : list[WordFeatures]
-        All words referering to humans in the sentence.
+        All words referering to humans in the sentence. Cached property.
 
     Methods
     -------
     from_text(text: str) -> SentenceAnalysis
         Create analysis from text string. Preprocesses text and applies spaCy NLP pipeline.
+    from_texts(texts: Iterable[str], batch_size: int = SPACY_BATCH_SIZE, n_process: int = 1) -> Iterator[SentenceAnalysis]
+        Create analyses from multiple text strings. The texts are processed by spaCy in batches.
+    docs_to_bytes(analyses: Iterable[SentenceAnalysis]) -> bytes
+        Serialize the parsed sentences of the analyses (e.g. to send them to another process or store them).
+    from_bytes(data: bytes) -> list[SentenceAnalysis]
+        Create analyses from sentences serialized with `docs_to_bytes`; the sentences are not parsed again.
     get_top_n_least_frequent(n: int = 5) -> list[tuple[WordFeatures, float]]
         Return the n words with lowest frequency scores.
+    count_non_punct(start: int, end: int) -> int | None
+        Number of non-punctuation tokens between two token indices of the parent Doc; None if the range is not within the sentence.
     get_sdl_info() -> list[SDLInfo]
         Syntactic dependency length information for each token.
         Each entry contains the token text, dependency length, and and a list of token's heads. For one-word sentences, an empty list is returned. Cached property.
@@ -184,14 +211,56 @@ class SentenceAnalysis:
         Create analysis from text string:
         (a) Load spaCy model
         (b) Pre-process text (clean-up) and create spaCy Doc object
+        The Docs of a small number of recently analyzed texts are cached and shared between analyses of the same text, so the Doc must not be modified (e.g. by setting entities or extension attributes).
         """
-        from lint_ii.linguistic_data.nlp_model import NLP_MODEL
         clean_text = preprocess_text(text)
-        doc = NLP_MODEL(clean_text)
+        doc = parse_text(clean_text)
         return cls(doc)
 
-    @property
+    @classmethod
+    def from_texts(
+        cls,
+        texts: Iterable[str],
+        batch_size: int = SPACY_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator['SentenceAnalysis']:
+        """
+        Create analyses from multiple text strings; same steps as `from_text`, but the texts are parsed in batches.
+        See `parse_texts` for `batch_size` and `n_process`.
+        """
+        for doc in parse_texts(map(preprocess_text, texts), batch_size=batch_size, n_process=n_process):
+            yield cls(doc)
+
+    @staticmethod
+    def docs_to_bytes(analyses: Iterable['SentenceAnalysis']) -> bytes:
+        """
+        Serialize the parsed sentences of the analyses with spaCy's `DocBin`, including all annotations used by the analysis.
+        Sentences that are a Span of a larger Doc are stored as a Doc of their own.
+        """
+        doc_bin = DocBin()
+        for analysis in analyses:
+            doc = analysis.doc
+            if isinstance(doc, Span):
+                # drop the whitespace after the last token, which is not part of the Span text
+                sent_doc = doc.as_doc()
+                spaces = [bool(token.whitespace_) for token in sent_doc]
+                spaces[-1] = False
+                doc = Doc(sent_doc.vocab, words=[token.text for token in sent_doc], spaces=spaces)
+                doc.from_array(doc_bin.attrs, sent_doc.to_array(doc_bin.attrs))
+            doc_bin.add(doc)
+        return doc_bin.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> list['SentenceAnalysis']:
+        """
+        Create analyses from sentences serialized with `docs_to_bytes`; pre-processing and parsing are skipped.
+        """
+        docs = DocBin().from_bytes(data).get_docs(get_nlp_model().vocab)
+        return [cls(doc) for doc in docs]
+
+    @cached_property
     def text(self) -> str:
+        """Sentence as string."""
         return self.doc.text
 
     # ── word features ────────────────────────────────────────────────────
@@ -204,6 +273,73 @@ class SentenceAnalysis:
             wf.sentence_analysis = self
         return wfs
 
+    @cached_property
+    def _buckets(self) -> _SentenceBuckets:
+        """
+        Sort the word features into the lists behind the sentence-level features, in a single pass over the words.
+        Nouns are sorted by their super semantic type; pronouns are grouped by person.
+        """
+        nouns: dict[SuperSemTypes, list[WordFeatures]] = {sem_type: [] for sem_type in SuperSemTypes}
+        content_words: list[WordFeatures] = []
+        finite_verbs: list[WordFeatures] = []
+        frequencies: list[float] = []
+        non_punct: list[WordFeatures] = []
+        dep_lengths: list[int] = []
+        pronouns: defaultdict[int, list[WordFeatures]] = defaultdict(list)
+
+        # bind the appends once; this loop runs for every word in the document
+        add_content_word = content_words.append
+        add_finite_verb = finite_verbs.append
+        add_frequency = frequencies.append
+        add_non_punct = non_punct.append
+        add_dep_length = dep_lengths.append
+
+        for feat in self.word_features:
+            if (sem_type := feat.super_sem_type) is not None:
+                nouns[sem_type].append(feat)
+            if feat.is_content_word:
+                add_content_word(feat)
+            if feat.is_finite_verb:
+                add_finite_verb(feat)
+            if (freq := feat.word_frequency) is not None:
+                add_frequency(freq)
+            if not feat.is_punctuation:
+                add_non_punct(feat)
+                add_dep_length(feat.dep_length)
+            if feat.is_pronoun:
+                pronouns[feat.pronoun_person].append(feat)
+
+        return _SentenceBuckets(
+            concrete=nouns[SuperSemTypes.CONCRETE],
+            abstract=nouns[SuperSemTypes.ABSTRACT],
+            undefined=nouns[SuperSemTypes.UNDEFINED],
+            unknown=nouns[SuperSemTypes.UNKNOWN],
+            content_words=content_words,
+            finite_verbs=finite_verbs,
+            frequencies=frequencies,
+            non_punct=non_punct,
+            dep_lengths=dep_lengths,
+            pronouns=pronouns,
+        )
+
+    @cached_property
+    def _non_punct_counts(self) -> list[int]:
+        """
+        Running count of the non-punctuation tokens (by dependency label) in the sentence; entry i is the number of such tokens before the i-th token.
+        """
+        return list(accumulate((token.dep != _PUNCT for token in self.doc), initial=0))
+
+    def count_non_punct(self, start: int, end: int) -> int | None:
+        """
+        Number of non-punctuation tokens in `doc[start:end]` (token indices in the parent Doc), from the running count.
+        Returns None if the range is not within the sentence.
+        """
+        offset = self.doc.start if isinstance(self.doc, Span) else 0
+        counts = self._non_punct_counts
+        if not offset <= start <= end < offset + len(counts):
+            return None
+        return counts[end - offset] - counts[start - offset]
+
     # ── core readability features ────────────────────────────────────────
 
     @cached_property
@@ -212,46 +348,30 @@ class SentenceAnalysis:
         Mean log frequency of content words (excluding proper nouns) in the sentence.
         Returns None if there are no frequencies in the sentence, i.e. no content words or all the content words are in the SKIPLIST.
         """
-        frequencies = [
-            freq
-            for feat in self.word_features
-            if (freq := feat.word_frequency) is not None
-        ]
+        frequencies = self._buckets.frequencies
         if not frequencies:
             return None
-        return statistics.mean(frequencies)
+        return fsum(frequencies) / len(frequencies)
 
     @property
     def concrete_nouns(self) -> list[WordFeatures]:
         """All concrete nouns in the sentence."""
-        return [
-            feat for feat in self.word_features
-            if feat.is_concrete
-        ]
+        return self._buckets.concrete
 
     @property
     def abstract_nouns(self) -> list[WordFeatures]:
         """All abstract nouns in the sentence."""
-        return [
-            feat for feat in self.word_features
-            if feat.is_abstract
-        ]
+        return self._buckets.abstract
 
     @property
     def undefined_nouns(self) -> list[WordFeatures]:
         """All undefined nouns in the sentence."""
-        return [
-            feat for feat in self.word_features
-            if feat.is_undefined
-        ]
+        return self._buckets.undefined
 
     @property
     def unknown_nouns(self) -> list[WordFeatures]:
         """All unknown nouns in the sentence."""
-        return [
-            feat for feat in self.word_features
-            if feat.is_unknown
-        ]
+        return self._buckets.unknown
 
     @cached_property
     def proportion_of_concrete_nouns(self) -> float | None:
@@ -274,10 +394,7 @@ class SentenceAnalysis:
         Maximum dependency length in the sentence.
         If there are no SDLs (i.e. one-word sentence), returns None.
         """
-        dep_lengths = [
-            feat.dep_length for feat in self.word_features
-            if not feat.is_punctuation
-        ]
+        dep_lengths = self._buckets.dep_lengths
         if len(dep_lengths) < 2:
             return None
 
@@ -286,18 +403,12 @@ class SentenceAnalysis:
     @property
     def finite_verbs(self) -> list[WordFeatures]:
         """All finite verbs in the sentence."""
-        return [
-            feat for feat in self.word_features
-            if feat.is_finite_verb
-        ]
+        return self._buckets.finite_verbs
 
     @property
     def content_words(self) -> list[WordFeatures]:
         """All content words in the sentence."""
-        return [
-            feat for feat in self.word_features
-            if feat.is_content_word
-        ]
+        return self._buckets.content_words
 
     @cached_property
     def content_words_per_clause(self) -> float | None:
@@ -326,7 +437,7 @@ class SentenceAnalysis:
     @cached_property
     def sent_length(self) -> int:
         """Number of tokens in the sentence (excluding punctuation)."""
-        return len([wf for wf in self.word_features if not wf.is_punctuation])
+        return len(self._buckets.non_punct)
 
     @cached_property
     def mean_clause_length(self) -> float:
@@ -409,11 +520,11 @@ class SentenceAnalysis:
             token
             for subtree in self.adjectival_modifiers
             for token in subtree
-            if token.dep_ == 'conj'
+            if token.dep == _CONJ
         ])
         return (n_adjmods + n_nested_adjmods) / n_finite_verbs
 
-    @property
+    @cached_property
     def coordinated_constituents(self) -> list[WordFeatures]:
         """List of coordinated constituents in the sentence."""
         return [feat for feat in self.word_features if feat.is_coordinated_constituent]
@@ -431,15 +542,10 @@ class SentenceAnalysis:
     @property
     def pronouns(self) -> dict[int, list[WordFeatures]]:
         """Pronouns in the sentence categorized by person (first, second, third)."""
-        from collections import defaultdict
+        # shallow copy: looking up a missing person must not add it to the cached mapping
+        return defaultdict(list, self._buckets.pronouns)
 
-        dct = defaultdict(list)
-        for feat in self.word_features:
-            if feat.is_pronoun:
-                dct[feat.pronoun_person].append(feat)
-        return dct
-
-    @property
+    @cached_property
     def humans(self) -> list[WordFeatures]:
         """All words referering to humans in the sentence."""
         return [
@@ -451,14 +557,14 @@ class SentenceAnalysis:
 
     def get_top_n_least_frequent(self, n: int = 5) -> list[tuple[WordFeatures, float]]:
         """Get the top n least frequent words in the sentence."""
-        frequencies = {
-            feat:freq
+        frequencies = [
+            (feat, freq)
             for feat in self.word_features
             if (freq := feat.word_frequency) is not None
-        }
+        ]
         if n == -1:
-            return sorted(frequencies.items(), key=itemgetter(1))
-        return sorted(frequencies.items(), key=itemgetter(1))[:n]
+            return sorted(frequencies, key=itemgetter(1))
+        return nsmallest(n, frequencies, key=itemgetter(1))
 
     def get_sdl_info(self) -> list[SDLInfo]:
         """
@@ -469,7 +575,7 @@ class SentenceAnalysis:
         -------------
         If the sentence consists of less than 2 tokens (excluding punctuation), an empty list is returned; i.e. there are no SDL's for a one-word sentence.
         """
-        feats = [feat for feat in self.word_features if not feat.is_punctuation]
+        feats = self._buckets.non_punct
         if len(feats) < 2:
             return []
         return [
@@ -484,7 +590,7 @@ class SentenceAnalysis:
     def get_detailed_analysis(self, n: int = 5) -> dict[str, Any]:
         """Get detailed analysis for the sentence."""
         return {
-            'text': self.doc.text,
+            'text': self.text,
             'score': self.lint.score,
             'level': self.lint.level,
             'mean_log_word_frequency': self.mean_log_word_frequency,
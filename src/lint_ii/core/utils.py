@@ -0,0 +1,46 @@
+"""Shared helpers for the analysis classes.
+
+Classes
+-------
+cached_property
+    Lock-free replacement for `functools.cached_property`.
+"""
+
+from typing import Any, Callable, Generic, TypeVar, overload
+
+
+_T = TypeVar('_T')
+
+
+class cached_property(Generic[_T]):
+    """
+    Decorator that turns a method into a property whose value is computed once and then stored in the instance `__dict__`.
+
+    Same behavior as `functools.cached_property`, without the lock that `functools.cached_property` acquires on every first access
+    (Python < 3.12). The analysis objects are not shared between threads while their features are computed, so the lock is pure overhead.
+    If two threads do compute the same property at the same time, both compute it and one value is kept.
+    """
+
+    def __init__(self, func: Callable[[Any], _T]) -> None:
+        self.func = func
+        self.attrname: str | None = None
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attrname = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> 'cached_property[_T]': ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> _T: ...
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        if self.attrname is None:
+            raise TypeError('Cannot use cached_property instance without calling __set_name__ on it.')
+        # the value is stored under the property name; since this is a non-data
+        # descriptor, later lookups find it in the instance __dict__ directly
+        value = instance.__dict__[self.attrname] = self.func(instance)
+        return value
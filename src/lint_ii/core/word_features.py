@@ -1,14 +1,79 @@
 from __future__ import annotations
-from functools import cached_property
-from typing import TypedDict, NotRequired, TYPE_CHECKING
+from collections import defaultdict
+from functools import cache
+from typing import Any, Callable, Iterable, Iterator, TypedDict, NotRequired, TYPE_CHECKING
 
+from spacy.strings import get_string_id
+from spacy.symbols import ADJ, ADV, NOUN, NUM, PRON, PROPN, VERB
 from spacy.tokens import Token
 
+from lint_ii.core.utils import cached_property
 from lint_ii import linguistic_data
 from lint_ii.linguistic_data import SuperSemTypes
+from lint_ii.linguistic_data.nlp_model import SPACY_BATCH_SIZE, parse_text, parse_texts
 if TYPE_CHECKING:
+    import pyarrow as pa
     from lint_ii.core.sentence_analysis import SentenceAnalysis
 
+
+# parts of speech as spaCy symbol IDs; comparing `token.pos` avoids a string lookup per check
+_NOUN_POS = frozenset({NOUN, PROPN})
+_CONTENT_WORD_POS = frozenset({NOUN, PROPN, VERB, ADJ})
+_ENTITY_OR_SITUATION_POS = frozenset({NOUN, PROPN, VERB})
+_COORDINATED_CONSTITUENT_POS = frozenset({NOUN, PROPN, PRON, ADJ, NUM, ADV})
+
+# dependency labels as string IDs; comparing `token.dep` avoids a string lookup per check
+_CONJ = get_string_id('conj')
+_COP = get_string_id('cop')
+_NSUBJ = get_string_id('nsubj')
+_PUNCT = get_string_id('punct')
+_AUX_PASS = get_string_id('aux:pass')
+_SUBORDINATE_DEPS = frozenset(map(get_string_id, ('acl:relcl', 'advcl', 'ccomp', 'csubj', 'acl')))
+_ADJ_MOD_DEPS = frozenset(map(get_string_id, ('amod', 'nummod', 'nmod', 'nmod:poss', 'acl')))
+
+# semantic types by their value in NOUN_DATA; a dict lookup instead of an enum call per noun
+_SUPER_SEM_TYPES = {sem_type.value: sem_type for sem_type in SuperSemTypes}
+
+
+def _memoize_by_tag(func: Callable[[str], Any]) -> Callable[[Token], Any]:
+    """
+    Turn a function of the fine-grained tag (`token.tag_`) into a function of the token that is computed once per tag.
+    The results are keyed by the tag's string ID (`token.tag`); the model has a small, fixed tag set.
+    """
+    results: dict[int, Any] = {}
+
+    def wrapper(token: Token) -> Any:
+        tag = token.tag
+        try:
+            return results[tag]
+        except KeyError:
+            result = results[tag] = func(token.tag_)
+            return result
+
+    return wrapper
+
+
+@cache
+def _get_wordlists():
+    """Import the word lists module on first use; importing it reads the word lists from disk."""
+    import lint_ii.linguistic_data.wordlists as wordlists
+    return wordlists
+
+
+# tests on the fine-grained (Alpino) tag; e.g. 'WW|pv|tgw|ev', 'VNW|pers|pron|nomin|vol|1|ev'
+_is_spec_tag = _memoize_by_tag(lambda tag: 'SPEC' in tag)  # SPEC = special token (names, symbols)
+_is_numeral_tag = _memoize_by_tag(lambda tag: 'TW' in tag)  # TW = telwoord
+_is_verb_tag = _memoize_by_tag(lambda tag: 'WW' in tag)  # WW = werkwoord
+_is_finite_verb_tag = _memoize_by_tag(lambda tag: 'WW|pv' in tag)  # WW|pv = werkwoord, persoonsvorm
+_is_indefinite_pronoun_tag = _memoize_by_tag(lambda tag: tag.startswith('VNW|onbep'))
+_is_pronoun_tag = _memoize_by_tag(
+    lambda tag: 'VNW' in tag and any(i in tag for i in ['|pers|', '|pr|', '|bez|'])
+)
+_pronoun_person_from_tag = _memoize_by_tag(
+    lambda tag: next((int(chr) for chr in tag if chr.isdigit()), None)
+)
+
+
 class WordFeaturesDict(TypedDict):
     text: str
     pos: str
@@ -38,9 +103,9 @@ class WordFeatures:
     token : Token
         The input spaCy token.
     text : str
-        Lowercase form of the token.
+        Lowercase form of the token. Cached property.
     lemma : str
-        Lowercase lemma of the token.
+        Lowercase lemma of the token. Cached property.
     word_frequency : float | None
         Word frequency from the SUBTLEX-NL corpus. Cached property.
     heads : list[Token]
@@ -51,7 +116,7 @@ class WordFeatures:
         True if token has one of the parts-of-speech: NOUN, PROPN.
     super_sem_type : SuperSemTypes | None
         Semantic type for nouns: 'concrete', 'abstract', 'undefined', or 'unknown'.
-        Measurement unit symbols (e.g. km) are considered nouns as well.
+        Measurement unit symbols (e.g. km) are considered nouns as well. Cached property.
     is_abstract : bool
         True if noun is semantically abstract (based on the annotations in NOUN_DATA or based on entity type heuristics).
     is_concrete : bool
@@ -101,8 +166,12 @@ class WordFeatures:
         Create feature extractor from a single word string.
         Note: this method is added for convenience and testing. Beware that spaCy may 
         be unable to correctly parse the word from a single word string context.
+    from_texts(texts: Iterable[str], batch_size: int = SPACY_BATCH_SIZE, n_process: int = 1) -> Iterator[WordFeatures]
+        Create feature extractors from multiple single word strings. The words are processed by spaCy in batches.
     as_dict() -> WordFeaturesDict
         Serialize features to dictionary format (used in the LiNT-II visualizer).
+    batch_to_arrow(features: Iterable[WordFeatures]) -> pa.RecordBatch
+        Serialize the features of multiple words to a PyArrow RecordBatch with the fields of `as_dict` as columns.
 
     Notes
     -----
@@ -167,22 +236,38 @@ class WordFeatures:
         cls,
         text: str,
     ) -> 'WordFeatures':
-        from lint_ii.linguistic_data.nlp_model import NLP_MODEL
-        doc = NLP_MODEL(text)
+        """
+        Create feature extractor from a single word string.
+        The Docs of a small number of recently used words are cached and shared between WordFeatures of the same word, so the Doc must not be modified.
+        """
+        doc = parse_text(text)
         return cls(doc[0])
 
+    @classmethod
+    def from_texts(
+        cls,
+        texts: Iterable[str],
+        batch_size: int = SPACY_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator['WordFeatures']:
+        """
+        Create feature extractors from multiple single word strings; same as `from_text`, but the words are parsed in batches.
+        See `parse_texts` for `batch_size` and `n_process`.
+        """
+        for doc in parse_texts(texts, batch_size=batch_size, n_process=n_process):
+            yield cls(doc[0])
+
     @property
     def _wordlists(self):
         """Lazy-load wordlists module."""
-        import lint_ii.linguistic_data.wordlists as wordlists
-        return wordlists
+        return _get_wordlists()
 
     @property
     def _NOUN_DATA(self) -> dict[str, dict[str, str]]:
         return self._wordlists.NOUN_DATA
 
     @property
-    def _MEASUREMENT_UNITS(self) -> list[str]:
+    def _MEASUREMENT_UNITS(self) -> frozenset[str]:
         return self._wordlists.MEASUREMENT_UNITS
 
     @property
@@ -190,20 +275,20 @@ class WordFeatures:
         return self._wordlists.FREQ_DATA
 
     @property
-    def _FREQ_SKIPLIST(self) -> list[str]:
+    def _FREQ_SKIPLIST(self) -> frozenset[str]:
         return self._wordlists.FREQ_SKIPLIST
 
     @property
-    def _MANNER_ADVERBS(self) -> list[str]:
+    def _MANNER_ADVERBS(self) -> frozenset[str]:
         return self._wordlists.MANNER_ADVERBS
 
     # ── text, lemma ──────────────────────────────────────────────────────
 
-    @property
+    @cached_property
     def text(self) -> str:
         return self.token.lower_
 
-    @property
+    @cached_property
     def lemma(self) -> str:
         return self.token.lemma_.lower()
 
@@ -244,9 +329,9 @@ class WordFeatures:
         - If a token is the subject, we check whether its head (ROOT) has conjuncts. If so, we consider the conjuncts as the heads of the subject as well. For example, in the sentence 'Dat geluid klinkt in het midden- en kleinbedrijf en moet worden gehoord.', the subject 'geluid' has two heads ['klinkt', 'gehoord'].
         """
         current_token = self.token
-        while current_token.dep_ == 'conj':
+        while current_token.dep == _CONJ:
             current_token = current_token.head
-        if current_token.dep_ == 'nsubj' and len(current_token.head.conjuncts) > 0:
+        if current_token.dep == _NSUBJ and len(current_token.head.conjuncts) > 0:
             return [
                 current_token.head,
                 *[conj for conj in current_token.head.conjuncts]
@@ -269,13 +354,19 @@ class WordFeatures:
         return max(self._calculate_dep_length(head) for head in self.heads)
 
     def _calculate_dep_length(self, head: Token) -> int:
-        if self.token.dep_ == 'punct':
+        if self.token.dep == _PUNCT:
             return 0
 
-        span = sorted([self.token.i, head.i])
-        part = self.token.doc[slice(*span)]
+        i, j = self.token.i, head.i
+        start, end = (i, j) if i < j else (j, i)
+        # within a sentence, count from the sentence's running count instead of scanning the tokens in between
+        n_tokens = None
+        if self.sentence_analysis is not None:
+            n_tokens = self.sentence_analysis.count_non_punct(start, end)
+        if n_tokens is None:
+            n_tokens = sum(t.dep != _PUNCT for t in self.token.doc[start:end])
 
-        dep_length = len([t for t in part if t.dep_ != 'punct']) - 1
+        dep_length = n_tokens - 1
         return dep_length if dep_length >= 0 else 0
 
     # ── noun semantic types ──────────────────────────────────────────────
@@ -286,23 +377,23 @@ class WordFeatures:
         Indicator whether word is a noun.
         True if token has one of the parts-of-speech: NOUN, PROPN.
         """
-        return self.token.pos_ in ["NOUN", "PROPN"]
+        return self.token.pos in _NOUN_POS
 
-    @property
+    @cached_property
     def super_sem_type(self) -> SuperSemTypes | None:
         """
         The semantic type of a noun.
         Measurement unit symbols (e.g. km) are considered nouns as well.
         """
         # take nouns and 'SPEC' tokens (accounts for cm, km, etc.)
-        if not self.is_noun and 'SPEC' not in self.token.tag_:
+        if not self.is_noun and not _is_spec_tag(self.token):
             return None
         
         if self.is_noun:
             return self._get_super_sem_type_for_noun()
 
         return (
-            SuperSemTypes('concrete')
+            SuperSemTypes.CONCRETE
             if self.text in self._MEASUREMENT_UNITS
             else None
         )
@@ -328,36 +419,36 @@ class WordFeatures:
   
         # if result was found then return the semantic type
         if result is not None:
-            return SuperSemTypes(result.get('super_sem_type'))
+            return _SUPER_SEM_TYPES[result.get('super_sem_type')]
 
         # if word and lemma not in list then try to resolve based on entity type
         if self.token.ent_type_ in ('PERSON', 'GPE'):
-            return SuperSemTypes('concrete')
+            return SuperSemTypes.CONCRETE
         if self.token.ent_type_ == 'ORG':
-            return SuperSemTypes('abstract')
+            return SuperSemTypes.ABSTRACT
         
         # resolve as unknown if all else fails
-        return SuperSemTypes('unknown')
+        return SuperSemTypes.UNKNOWN
 
     @property
     def is_abstract(self) -> bool:
         """Indicator whether semantic type is abstract."""
-        return self.super_sem_type == SuperSemTypes.ABSTRACT
+        return self.super_sem_type is SuperSemTypes.ABSTRACT
 
     @property
     def is_concrete(self) -> bool:
         """Indicator whether semantic type is concrete."""
-        return self.super_sem_type == SuperSemTypes.CONCRETE
+        return self.super_sem_type is SuperSemTypes.CONCRETE
 
     @property
     def is_undefined(self) -> bool:
         """Indicator whether semantic type is undefined."""
-        return self.super_sem_type == SuperSemTypes.UNDEFINED
+        return self.super_sem_type is SuperSemTypes.UNDEFINED
 
     @property
     def is_unknown(self) -> bool:
         """Indicator whether semantic type is unknown."""
-        return self.super_sem_type == SuperSemTypes.UNKNOWN
+        return self.super_sem_type is SuperSemTypes.UNKNOWN
 
     # ── content words ────────────────────────────────────────────────────
 
@@ -373,33 +464,33 @@ class WordFeatures:
         - Copulas are excluded (sometimes tagged as VERB)
         - Adverbs are excluded except for manner adverbs
         """
-        if 'TW' in self.token.tag_: # TW = telwoord
+        if _is_numeral_tag(self.token):
             return False
-        if self.token.dep_ == 'cop':
+        if self.token.dep == _COP:
             return False
         return (
-            self.token.pos_ in ["NOUN", "PROPN", "VERB", "ADJ"]
+            self.token.pos in _CONTENT_WORD_POS
             or self.text in self._MANNER_ADVERBS
         )
     
     @property
     def is_content_word_excl_propn(self) -> bool:
         """Indicator whether word is a content word, excluding proper nouns."""
-        return False if self.token.pos_ == 'PROPN' else self.is_content_word
+        return False if self.token.pos == PROPN else self.is_content_word
 
     # ── finite verbs ─────────────────────────────────────────────────────
 
     @property
     def is_finite_verb(self) -> bool:
         """Indicator whether word is a finite verb."""
-        return "WW|pv" in self.token.tag_ # WW|pv = werkwoord, persoonsvorm
+        return _is_finite_verb_tag(self.token)
 
     # ── passive & subordinate clause ─────────────────────────────────────
 
     @cached_property
     def is_passive_auxiliary(self) -> bool:
         """Indicator whether token is passive auxiliary."""
-        return self.token.dep_ == 'aux:pass'
+        return self.token.dep == _AUX_PASS
 
     @cached_property
     def is_in_subordinate_clause(self) -> bool:
@@ -412,47 +503,40 @@ class WordFeatures:
         
         The function uses the resolved dependency label. If a token is a conjunct the dependency label is recursively taken from its head.
         """
-        subordinate_deps = ['acl:relcl', 'advcl', 'ccomp', 'csubj', 'acl']
-
-        if self._resolved_dependency not in subordinate_deps:
+        if self._resolved_dependency not in _SUBORDINATE_DEPS:
             return False
 
         # token or one of its descendants is a verb 
         for token in self.token.subtree:
-            if 'WW' in token.tag_:
+            if _is_verb_tag(token):
                 return True
         return False
 
     @cached_property
-    def _resolved_dependency(self) -> str:
+    def _resolved_dependency(self) -> int:
         """
-        Token dependency label.
+        Token dependency label (as spaCy string ID).
         
         If token is conjunct the dependency label is recursively taken from its head.
         """
         current_token = self.token
-        while current_token.dep_ == 'conj':
+        while current_token.dep == _CONJ:
             current_token = current_token.head
-        return current_token.dep_
+        return current_token.dep
 
     # ── pronoun & human ──────────────────────────────────────────────────
 
     @cached_property
     def is_pronoun(self) -> bool:
         """Indicator whether token is a pronoun."""
-        tag = self.token.tag_
-        pron_types = ['|pers|', '|pr|', '|bez|']
-        return 'VNW' in tag and any(i in tag for i in pron_types)
+        return _is_pronoun_tag(self.token)
 
     @cached_property
     def pronoun_person(self) -> int | None:
         """Person of the pronoun (first, second, third)."""
         if not self.is_pronoun:
             return None
-
-        for chr in self.token.tag_:
-            if chr.isdigit():
-                return int(chr)
+        return _pronoun_person_from_tag(self.token)
 
     @cached_property
     def is_human(self) -> bool:
@@ -485,7 +569,7 @@ class WordFeatures:
             'enkelen',
             'beiden',
         ]
-        if self.token.tag_.startswith('VNW|onbep') and self.text in indefinite_pronouns:
+        if _is_indefinite_pronoun_tag(self.token) and self.text in indefinite_pronouns:
             return True
 
         if not self.is_noun:
@@ -513,9 +597,9 @@ class WordFeatures:
         -------------
         - Copulas are excluded (sometimes tagged as VERB)
         """
-        if self.token.dep_ == 'cop':
+        if self.token.dep == _COP:
             return False
-        if self.token.pos_ in ["NOUN", "PROPN", "VERB"]:
+        if self.token.pos in _ENTITY_OR_SITUATION_POS:
             return True
         if self.is_pronoun:
             return True
@@ -562,17 +646,9 @@ class WordFeatures:
         True if token is not an adverb and has one of the following dependency labels:
         amod, nummod, nmod, nmod:poss, acl.
         """
-        if self.token.pos_ == 'ADV':
+        if self.token.pos == ADV:
             return False
-
-        adj_mod_deps = [
-            'amod',
-            'nummod',
-            'nmod',
-            'nmod:poss',
-            'acl',
-        ]
-        return self.token.dep_ in adj_mod_deps
+        return self.token.dep in _ADJ_MOD_DEPS
 
     @property
     def is_coordinated_constituent(self) -> bool:
@@ -581,18 +657,10 @@ class WordFeatures:
         True if token has dependency label 'conj' and one of the following parts of speech: 'NOUN', 'PROPN', 'PRON', 'ADJ', 'NUM', 'ADV'.
         This excludes coordinated clauses.
         """
-        if self.token.dep_ != 'conj':
+        if self.token.dep != _CONJ:
             return False
         
-        included_pos = [
-            'NOUN',
-            'PROPN',
-            'PRON',
-            'ADJ',
-            'NUM',
-            'ADV',
-        ]
-        return self.token.pos_ in included_pos
+        return self.token.pos in _COORDINATED_CONSTITUENT_POS
 
     # ── punctuation ──────────────────────────────────────────────────────
 
@@ -604,8 +672,6 @@ class WordFeatures:
     @cached_property
     def punctuation(self) -> dict[str, str] | None:
         """Attached punctuation to a token. Used in the visualizer."""
-        from collections import defaultdict
-
         punctuation = defaultdict(str)
         if self.token.is_punct:
             is_left_edge = self.token.i == 0
@@ -658,4 +724,40 @@ class WordFeatures:
         if (punct := self.punctuation) is not None:
             result['punctuation'] = punct
 
-        return result
\ No newline at end of file
+        return result
+
+    @staticmethod
+    def batch_to_arrow(features: Iterable['WordFeatures']) -> 'pa.RecordBatch':
+        """
+        Serialize the features of multiple words to a PyArrow RecordBatch, one row per word.
+        The columns are the fields of `as_dict`; the fields that `as_dict` leaves out are null.
+        """
+        import pyarrow as pa
+
+        text, tag, pos, word_frequency, dep_length, super_sem_type, punctuation = [], [], [], [], [], [], []
+        for feat in features:
+            text.append(feat.text)
+            tag.append(feat.token.tag_)
+            pos.append(feat.token.pos_)
+            word_frequency.append(feat.word_frequency)
+            dep_length.append(feat.dep_length or None)
+            super_sem_type.append(None if (sem := feat.super_sem_type) is None else sem.value)
+            punctuation.append(feat.punctuation)
+
+        punctuation_type = pa.struct([
+            ('leading', pa.string()),
+            ('trailing', pa.string()),
+            ('standalone', pa.string()),
+        ])
+        return pa.RecordBatch.from_arrays(
+            [
+                pa.array(text, type=pa.string()),
+                pa.array(tag, type=pa.string()),
+                pa.array(pos, type=pa.string()),
+                pa.array(word_frequency, type=pa.float64()),
+                pa.array(dep_length, type=pa.int64()),
+                pa.array(super_sem_type, type=pa.string()),
+                pa.array(punctuation, type=punctuation_type),
+            ],
+            names=['text', 'tag', 'pos', 'word_frequency', 'dep_length', 'super_sem_type', 'punctuation'],
+        )
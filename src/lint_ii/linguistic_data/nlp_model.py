@@ -1,12 +1,59 @@
+from functools import lru_cache
+from typing import Iterable, Iterator
+import os
+
 import spacy
 from spacy.language import Language
+from spacy.tokens import Doc
 
 from lint_ii import LiNT_II_Exception
 
 
-try:
-    print('Loading Dutch language model from spaCy... ', end='')
-    NLP_MODEL : Language = spacy.load('nl_core_news_lg')
-    print('✓ nl_core_news_lg')
-except OSError:
-    raise LiNT_II_Exception('LiNT-II requires the spaCy model "nl_core_news_lg"; download the model by running: `python -m spacy download nl_core_news_lg`')
+# default number of texts that spaCy parses per batch in the `from_texts` constructors
+SPACY_BATCH_SIZE = int(os.environ.get('LINT_II_SPACY_BATCH_SIZE', 50))
+
+
+@lru_cache(maxsize=1)
+def load_nlp_model(name: str = 'nl_core_news_lg') -> Language:
+    """Load a spaCy model; only the most recently loaded model is kept in memory, since a full pipeline is large."""
+    try:
+        print(f'Loading spaCy model {name}... ', end='')
+        nlp = spacy.load(name)
+        print(f'✓ {name}')
+    except OSError:
+        raise LiNT_II_Exception(f'LiNT-II requires the spaCy model "{name}"; download the model by running: `python -m spacy download {name}`')
+    return nlp
+
+
+def get_nlp_model() -> Language:
+    """Return the Dutch spaCy model used by LiNT-II; it is loaded on the first call."""
+    return load_nlp_model('nl_core_news_lg')
+
+
+@lru_cache(maxsize=8)
+def parse_text(text: str) -> Doc:
+    """
+    Parse a short (pre-processed) text, i.e. a sentence or a word, with the Dutch spaCy model; the Docs of a small number of recently parsed texts are cached.
+    The cached Docs are shared between callers and must not be modified. Documents are parsed with `get_nlp_model()(text)` instead.
+    """
+    return get_nlp_model()(text)
+
+
+def parse_texts(
+    texts: Iterable[str],
+    batch_size: int = SPACY_BATCH_SIZE,
+    n_process: int = 1,
+) -> Iterator[Doc]:
+    """
+    Parse multiple (pre-processed) texts with the Dutch spaCy model in batches (`nlp.pipe`), which is faster than parsing them one at a time.
+    The default batch_size is `SPACY_BATCH_SIZE`, which can be set with the environment variable LINT_II_SPACY_BATCH_SIZE.
+    Use n_process > 1 (or -1 for all CPUs) to parse in parallel processes; this only pays off for large batches (hundreds of texts).
+    """
+    return get_nlp_model().pipe(texts, batch_size=batch_size, n_process=n_process)
+
+
+def __getattr__(name: str) -> Language:
+    # `NLP_MODEL` is kept for backwards compatibility; it is loaded on first access
+    if name == 'NLP_MODEL':
+        return get_nlp_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
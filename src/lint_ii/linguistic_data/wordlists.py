@@ -34,8 +34,14 @@ FREQ_DATA = {
     for row in pq.read_table(path_word_freq).to_pylist()
 }
 
-FREQ_SKIPLIST = pq.read_table(path_word_freq_skiplist).to_pydict().get('word')
+FREQ_SKIPLIST = frozenset(
+    pq.read_table(path_word_freq_skiplist).to_pydict().get('word')
+)
 
-MANNER_ADVERBS = pq.read_table(path_manner_adverbs).to_pydict().get('adverb')
+MANNER_ADVERBS = frozenset(
+    pq.read_table(path_manner_adverbs).to_pydict().get('adverb')
+)
 
-MEASUREMENT_UNITS = pq.read_table(path_measurement_units).to_pydict().get('symbol')
+MEASUREMENT_UNITS = frozenset(
+    pq.read_table(path_measurement_units).to_pydict().get('symbol')
+)
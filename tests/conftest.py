@@ -0,0 +1,50 @@
+import pytest
+import spacy
+from spacy.tokens import Doc
+
+
+# two hand-annotated sentences (UD labels and Alpino tags as produced by nl_core_news_lg)
+TOKENS = [
+    # text, pos, tag, dep, head, lemma, ent
+    ('Jan', 'PROPN', 'SPEC|deeleigen', 'nsubj', 1, 'Jan', 'B-PERSON'),
+    ('loopt', 'VERB', 'WW|pv|tgw|met-t', 'ROOT', 1, 'lopen', 'O'),
+    ('in', 'ADP', 'VZ|init', 'case', 5, 'in', 'O'),
+    ('de', 'DET', 'LID|bep|stan|rest', 'det', 5, 'de', 'O'),
+    ('mooie', 'ADJ', 'ADJ|prenom|basis|met-e|stan', 'amod', 5, 'mooi', 'O'),
+    ('stad', 'NOUN', 'N|soort|ev|basis|zijd|stan', 'obl', 1, 'stad', 'O'),
+    (',', 'PUNCT', 'LET', 'punct', 9, ',', 'O'),
+    ('en', 'CCONJ', 'VG|neven', 'cc', 9, 'en', 'O'),
+    ('hij', 'PRON', 'VNW|pers|pron|nomin|vol|3|ev|masc', 'nsubj', 9, 'hij', 'O'),
+    ('slaapt', 'VERB', 'WW|pv|tgw|met-t', 'conj', 1, 'slapen', 'O'),
+    ('.', 'PUNCT', 'LET', 'punct', 1, '.', 'O'),
+    ('Het', 'DET', 'LID|bep|stan|evon', 'det', 12, 'het', 'O'),
+    ('kabinet', 'NOUN', 'N|soort|ev|basis|onz|stan', 'nsubj:pass', 14, 'kabinet', 'O'),
+    ('wordt', 'AUX', 'WW|pv|tgw|met-t', 'aux:pass', 14, 'worden', 'O'),
+    ('gehoord', 'VERB', 'WW|vd|vrij|zonder', 'ROOT', 14, 'horen', 'O'),
+    ('door', 'ADP', 'VZ|init', 'case', 16, 'door', 'O'),
+    ('iemand', 'PRON', 'VNW|onbep|pron|stan|vol|3p|ev', 'obl:agent', 14, 'iemand', 'O'),
+    ('.', 'PUNCT', 'LET', 'punct', 14, '.', 'O'),
+]
+
+
+@pytest.fixture(scope='session')
+def nlp() -> spacy.Language:
+    """Blank Dutch pipeline; only its vocab is used, so the tests do not need `nl_core_news_lg`."""
+    return spacy.blank('nl')
+
+
+@pytest.fixture
+def doc(nlp) -> Doc:
+    words, pos, tags, deps, heads, lemmas, ents = zip(*TOKENS)
+    spaces = [i + 1 < len(words) and words[i + 1] not in {',', '.'} for i in range(len(words))]
+    return Doc(
+        nlp.vocab,
+        words=list(words),
+        spaces=spaces,
+        pos=list(pos),
+        tags=list(tags),
+        deps=list(deps),
+        heads=list(heads),
+        lemmas=list(lemmas),
+        ents=list(ents),
+    )
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from lint_ii.core.lint_scorer import LintScorer
+
+
+FEATURES = [
+    [5.2, 3, 4.5, 0.6],
+    [3.1, 8, 6.0, 0.0],
+    [9.0, 0, 0.0, 1.0],
+    [1.0, 20, 12.0, 0.1],
+]
+
+
+def test_score_batch_matches_score():
+    scores = LintScorer.score_batch(np.array(FEATURES))
+    assert scores.tolist() == [LintScorer(*row).score for row in FEATURES]
+
+
+def test_score_batch_missing_feature_gives_nan():
+    scores = LintScorer.score_batch(np.array([[5.2, np.nan, 4.5, 0.6]]))
+    assert np.isnan(scores).all()
+
+
+@pytest.mark.parametrize('features', [
+    np.array(FEATURES).ravel(),
+    np.array(FEATURES[:3]).T,
+    np.array(FEATURES)[:, :3],
+    np.zeros((2, 4, 1)),
+])
+def test_score_batch_rejects_wrong_shape(features):
+    with pytest.raises(ValueError):
+        LintScorer.score_batch(features)
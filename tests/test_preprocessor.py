@@ -0,0 +1,99 @@
+"""
+Regression checks for the fast paths in `lint_ii.core.preprocessor`.
+
+`preprocess_text` skips the Markdown parser for texts without Markdown syntax (`_MD_SENTINEL`), and
+the parser skips inline tokenization for block text without inline markup (`_PlainTextInlineParser`,
+which overrides mistune's `InlineParser.__call__`). The results are compared with the full Markdown
+AST path, without either shortcut, on a fixed corpus and on randomly generated texts.
+"""
+
+import random
+
+import mistune
+
+from lint_ii.core.preprocessor import (
+    _MD_SENTINEL,
+    _TEXT_NODE_TYPES,
+    _collapse_whitespace,
+    extract_text_from_node,
+    fix_quotemarks,
+    preprocess_text,
+)
+
+
+def reference_preprocess_text(text: str) -> str:
+    """Pre-processing via mistune's default Markdown AST parser, for every text."""
+    markdown = mistune.create_markdown(renderer='ast')
+    nodes: list[dict] = markdown(text)  # type: ignore
+    paragraphs = [
+        extract_text_from_node(node)
+        for node in nodes
+        if node['type'] in _TEXT_NODE_TYPES
+    ]
+    return _collapse_whitespace(fix_quotemarks(' '.join(paragraphs)))
+
+
+CORPUS = [
+    '',
+    '   ',
+    'Jip zit bij de kapper. Knip, knap, zegt de schaar.',
+    'De Oudegracht is het sfeervolle hart van de stad.\nIn de middeleeuwen was het hier druk.\n\nNu is het een „prachtige” plek.',
+    'Hij zei: «Kom maar binnen.» En ze kwam binnen.',
+    '  Tekst met spaties aan het begin en het eind.  \n',
+    'Regel één  \nRegel twee\\\nRegel drie',
+    '# Kop\n\nEen alinea onder de kop.',
+    'Kop\n===\n\nTekst onder een setext-kop.',
+    'Ondertitel\n---\nen tekst',
+    '> Een citaat\n> over twee regels.\n\nEn daarna gewone tekst.',
+    '- eerste punt\n- tweede punt\n\n1. stap een\n2) stap twee',
+    '* ster\n+ plus\n\n10. tien',
+    '    ingesprongen code\n\nen tekst',
+    '```\ncode\n```\n\nNa het codeblok.',
+    '~~~\ncode\n~~~\ntekst',
+    '***\n\n---\n\n_ _ _\n\nNa de lijnen.',
+    'Tekst met *nadruk*, **sterk**, _onderstreept_ en __dubbel__.',
+    'Een woord_met_lage_streepjes en een_woord.',
+    'Een `code span` en een [link](https://example.com) en ![plaatje](a.png).',
+    'Een <b>html</b> tag en een escape \\* ster.',
+    'Entiteiten: &amp; &eacute; &#123; & losse ampersand.',
+    'Het is 3.5 graden en 1.000 mensen.\n2.5 procent is weinig.',
+    'Tabs\tin\tde\ttekst\r\nmet Windows-regeleinden.\r\n',
+    'Niet-ASCII spaties:\xa0hier, daar en\x85ook.',
+    'Verticale tab\x0bin de tekst\x0c en formfeed.',
+    'Tekst\n\xa0',
+    '# ',
+    '#######zeven hekjes',
+    'a\n-5 graden',
+    '1234567890. te lang voor een lijst',
+]
+
+ALPHABET = list('abc de fg') + [
+    '\n', '\n\n', '  ', '\t', '#', '*', '_', '>', '-', '+', '`', '[', ']', '(', ')', '|', '<', '&amp;',
+    '\\', '1.', '2)', '=', '~', '!', '“', '”', '«', '‘', 'é', '    ', '<b>', 'http://x.nl', '&', ':', "'",
+    '"', '\xa0', '\x0b', '\x0c', '\r', '\u2003', '\u2028', '\x85', '&eacute;', '&#123;', 'a_b', '*a*',
+    '![', '\n- ', '\n-5', '\n3.5', '\n1. ', '\n1)', '\n#a', '\n# ', '\n---', '\n- - -', '\n===', '\n~~~',
+    '_a', 'a_', 'é_é', '\n+ ', '\n  ', '\n   ', '\n>', '\n######', '\n#######', '1234567890.', '___', '**',
+    'word ', 'woord',
+]
+
+
+def random_texts(n: int = 5000, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+        for _ in range(n)
+    ]
+
+
+def test_plain_text_fast_path_matches_markdown_path():
+    texts = [text for text in CORPUS + random_texts() if _MD_SENTINEL.search(text) is None]
+    assert texts
+    for text in texts:
+        assert preprocess_text(text) == reference_preprocess_text(text), repr(text)
+
+
+def test_markdown_path_matches_full_inline_parsing():
+    texts = [text for text in CORPUS + random_texts() if _MD_SENTINEL.search(text) is not None]
+    assert texts
+    for text in texts:
+        assert preprocess_text(text) == reference_preprocess_text(text), repr(text)
@@ -0,0 +1,19 @@
+import io
+import json
+
+import pytest
+
+from lint_ii.core.readability_analysis import ReadabilityAnalysis
+from lint_ii.core.sentence_analysis import SentenceAnalysis
+
+
+@pytest.mark.parametrize('n_sentences', [0, 1, 2])
+def test_dump_json_matches_as_dict(doc, n_sentences):
+    sentences = [SentenceAnalysis(sent) for sent in list(doc.sents)[:n_sentences]]
+    analysis = ReadabilityAnalysis(sentences)
+
+    fp = io.StringIO()
+    analysis.dump_json(fp)
+
+    assert json.loads(fp.getvalue()) == analysis.as_dict()
+    assert list(analysis.iter_sentence_dicts()) == analysis.as_dict()['sentences']
@@ -0,0 +1,47 @@
+import pytest
+
+from lint_ii.core import sentence_analysis
+from lint_ii.core.sentence_analysis import SentenceAnalysis
+
+
+def test_docs_to_bytes_round_trip(doc, nlp, monkeypatch):
+    monkeypatch.setattr(sentence_analysis, 'get_nlp_model', lambda: nlp)
+    analyses = [SentenceAnalysis(sent) for sent in doc.sents] + [SentenceAnalysis(doc)]
+
+    restored = SentenceAnalysis.from_bytes(SentenceAnalysis.docs_to_bytes(analyses))
+
+    assert [a.text for a in restored] == [a.text for a in analyses]
+    assert [a.as_dict() for a in restored] == [a.as_dict() for a in analyses]
+
+
+def _token_slice_dep_length(feat) -> int:
+    """Dependency length counted over the tokens between the word and each head (the implementation before the running count)."""
+    if feat.token.dep_ == 'punct':
+        return 0
+    lengths = []
+    for head in feat.heads:
+        start, end = sorted([feat.token.i, head.i])
+        n_tokens = len([t for t in feat.token.doc[start:end] if t.dep_ != 'punct'])
+        lengths.append(max(n_tokens - 1, 0))
+    return max(lengths)
+
+
+@pytest.mark.parametrize('span', [
+    pytest.param(lambda doc: list(doc.sents)[0], id='first sentence'),
+    pytest.param(lambda doc: list(doc.sents)[1], id='second sentence'),
+    pytest.param(lambda doc: doc, id='whole doc'),
+    # 'stad' and 'slaapt' have their head ('loopt') outside the span
+    pytest.param(lambda doc: doc[2:10], id='heads outside span'),
+])
+def test_dep_length_matches_token_slice_count(doc, span):
+    analysis = SentenceAnalysis(span(doc))
+    for feat in analysis.word_features:
+        assert feat.dep_length == _token_slice_dep_length(feat), feat.text
+
+
+def test_count_non_punct(doc):
+    second = SentenceAnalysis(list(doc.sents)[1])
+    assert second.count_non_punct(11, 18) == 6
+    assert second.count_non_punct(12, 14) == 2
+    assert second.count_non_punct(5, 14) is None
+    assert second.count_non_punct(11, 19) is None